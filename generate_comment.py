@@ -4,6 +4,7 @@ import json
 import time
 import base64
 import random
+import re
 import requests
 from pathlib import Path
 from typing import List, Dict, Any
@@ -39,6 +40,98 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 
 STATUS_FILE = Path("comment_status.json")
 POST_DATA_FILE = Path("post_to_comment.json")
+PROFILE_BUTTON_REGEX = re.compile(r'.*Free, open')
+
+# LinkedIn comment prompt; {post_content} run time pe bhara jata hai
+COMMENT_PROMPT_TEMPLATE = (
+    "IMPORTANT: Your entire response must be wrapped inside a single ```json code block. "
+    "Do not output any text, explanation, markdown, commentary, or notes before or after the code block.\n\n"
+
+    "Read the following LinkedIn post carefully:\n"
+    "\"\"\"\n{post_content}\n\"\"\"\n\n"
+
+    "Your task is to write a thoughtful, professional, and discussion-worthy LinkedIn comment.\n\n"
+
+    "PRIMARY OBJECTIVE:\n"
+    "Write the kind of comment that a knowledgeable industry peer would naturally leave after reading the post.\n"
+    "The comment should contribute something useful to the conversation rather than merely reacting to it.\n\n"
+
+    "THE GOAL IS NOT TO:\n"
+    "- Praise the author\n"
+    "- Compliment the post\n"
+    "- Summarize the post\n"
+    "- Repeat the author's main point\n"
+    "- Sound like a corporate chatbot\n"
+    "- Sound like an AI assistant\n\n"
+
+    "THE GOAL IS TO:\n"
+    "- Advance the discussion\n"
+    "- Add a practical real-world consideration\n"
+    "- Introduce a nuance, tradeoff, edge case, or second-order implication\n"
+    "- Surface an observation that practitioners in the field would recognize\n"
+    "- Provide a perspective that was not explicitly stated in the original post\n\n"
+
+    "SILENT ANALYSIS:\n"
+    "Before writing the comment:\n"
+    "1. Identify the core idea of the post.\n"
+    "2. Identify a practical implication, overlooked consideration, edge case, tradeoff, or downstream consequence.\n"
+    "3. Build the comment around that insight.\n"
+    "4. Prefer practitioner-level observations over theoretical commentary.\n\n"
+
+    "TONE:\n"
+    "Write like an experienced professional sharing one useful thought while scrolling LinkedIn.\n"
+    "Sound intelligent, observant, practical, conversational, and natural.\n"
+    "Write as a reaction, not as a mini-article.\n"
+    "If someone got a certification, appraisal, promotion or got hired. Simply praise him/her and nothing more.\n"
+    "The comment should feel spontaneous rather than carefully crafted.\n\n"
+
+    "DO NOT SOUND LIKE:\n"
+    "- A motivational influencer\n"
+    "- A life coach\n"
+    "- A marketer\n"
+    "- A thought-leadership cliché generator\n"
+    "- An academic paper\n\n"
+
+    "HUMANNESS RULE:\n"
+    "The comment should feel like it was written by a busy but sharp professional who had one genuinely useful thought while reading the post.\n"
+    "No artificial profundity.\n"
+    "No exaggerated wisdom.\n"
+    "No performative intelligence.\n\n"
+
+    "LENGTH:\n"
+    "Preferred range: 80-220 characters including spaces.\n"
+    "Be concise.\n\n"
+
+    "FORMAT RULES:\n"
+    "- Single continuous line\n"
+    "- No newline characters\n"
+    "- No emojis\n"
+    "- No hashtags\n"
+    "- No markdown\n"
+    "- No greetings\n"
+    "- No sign-offs\n\n"
+
+    "AVOID COMMON AI PHRASES:\n"
+    "- This resonates deeply\n"
+    "- Insightful share\n"
+    "- Thanks for sharing\n"
+    "- Spot on\n"
+    "- Couldn't agree more\n"
+    "- Well said\n"
+    "- Great reminder\n"
+    "- Valuable perspective\n"
+    "- You've captured a crucial point\n"
+    "- Or similar generic praise\n\n"
+
+    "QUALITY CHECK:\n"
+    "The comment should make an informed reader think:\n"
+    "'That's a good point—I hadn't considered that angle.'\n\n"
+
+    "OUTPUT FORMAT — STRICTLY INSIDE A SINGLE JSON CODE BLOCK:\n"
+    "{{\n"
+    '  "comment": "Your direct single-line LinkedIn comment here"\n'
+    "}}\n"
+)
 
 
 # =========================
@@ -196,6 +289,7 @@ def run():
     pw = pw_cm.__enter__()
 
     browser = None
+    page = None
     try:
         browser = pw.chromium.launch(
             headless=HEADLESS,
@@ -225,7 +319,7 @@ def run():
 
         # CHECK LOGIN SUCCESS VIA USER PROFILE BUTTON
         print("[STEP] Checking login success via profile button...", flush=True)
-        profile_button = page.get_by_role('button', name=list(map(lambda x: x.compile(r'.*Free, open'), [__import__('re')]))[0])
+        profile_button = page.get_by_role('button', name=PROFILE_BUTTON_REGEX)
         
         if profile_button.count() > 0:
             print(f"[OK] LOGIN SUCCESS: Profile button found -> '{profile_button.first.get_attribute('aria-label') or 'User Account'}'", flush=True)
@@ -253,95 +347,7 @@ def run():
         # =========================================================
         # LINKEDIN OPTIMIZED PROMPT 
         # =========================================================
-        prompt = (
-            f"IMPORTANT: Your entire response must be wrapped inside a single ```json code block. "
-            f"Do not output any text, explanation, markdown, commentary, or notes before or after the code block.\n\n"
-
-            f"Read the following LinkedIn post carefully:\n"
-            f"\"\"\"\n{post_content}\n\"\"\"\n\n"
-
-            f"Your task is to write a thoughtful, professional, and discussion-worthy LinkedIn comment.\n\n"
-
-            f"PRIMARY OBJECTIVE:\n"
-            f"Write the kind of comment that a knowledgeable industry peer would naturally leave after reading the post.\n"
-            f"The comment should contribute something useful to the conversation rather than merely reacting to it.\n\n"
-
-            f"THE GOAL IS NOT TO:\n"
-            f"- Praise the author\n"
-            f"- Compliment the post\n"
-            f"- Summarize the post\n"
-            f"- Repeat the author's main point\n"
-            f"- Sound like a corporate chatbot\n"
-            f"- Sound like an AI assistant\n\n"
-
-            f"THE GOAL IS TO:\n"
-            f"- Advance the discussion\n"
-            f"- Add a practical real-world consideration\n"
-            f"- Introduce a nuance, tradeoff, edge case, or second-order implication\n"
-            f"- Surface an observation that practitioners in the field would recognize\n"
-            f"- Provide a perspective that was not explicitly stated in the original post\n\n"
-
-            f"SILENT ANALYSIS:\n"
-            f"Before writing the comment:\n"
-            f"1. Identify the core idea of the post.\n"
-            f"2. Identify a practical implication, overlooked consideration, edge case, tradeoff, or downstream consequence.\n"
-            f"3. Build the comment around that insight.\n"
-            f"4. Prefer practitioner-level observations over theoretical commentary.\n\n"
-
-            f"TONE:\n"
-            f"Write like an experienced professional sharing one useful thought while scrolling LinkedIn.\n"
-            f"Sound intelligent, observant, practical, conversational, and natural.\n"
-            f"Write as a reaction, not as a mini-article.\n"
-            f"If someone got a certification, appraisal, promotion or got hired. Simply praise him/her and nothing more.\n"
-            f"The comment should feel spontaneous rather than carefully crafted.\n\n"
-
-            f"DO NOT SOUND LIKE:\n"
-            f"- A motivational influencer\n"
-            f"- A life coach\n"
-            f"- A marketer\n"
-            f"- A thought-leadership cliché generator\n"
-            f"- An academic paper\n\n"
-
-            f"HUMANNESS RULE:\n"
-            f"The comment should feel like it was written by a busy but sharp professional who had one genuinely useful thought while reading the post.\n"
-            f"No artificial profundity.\n"
-            f"No exaggerated wisdom.\n"
-            f"No performative intelligence.\n\n"
-
-            f"LENGTH:\n"
-            f"Preferred range: 80-220 characters including spaces.\n"
-            f"Be concise.\n\n"
-
-            f"FORMAT RULES:\n"
-            f"- Single continuous line\n"
-            f"- No newline characters\n"
-            f"- No emojis\n"
-            f"- No hashtags\n"
-            f"- No markdown\n"
-            f"- No greetings\n"
-            f"- No sign-offs\n\n"
-
-            f"AVOID COMMON AI PHRASES:\n"
-            f"- This resonates deeply\n"
-            f"- Insightful share\n"
-            f"- Thanks for sharing\n"
-            f"- Spot on\n"
-            f"- Couldn't agree more\n"
-            f"- Well said\n"
-            f"- Great reminder\n"
-            f"- Valuable perspective\n"
-            f"- You've captured a crucial point\n"
-            f"- Or similar generic praise\n\n"
-
-            f"QUALITY CHECK:\n"
-            f"The comment should make an informed reader think:\n"
-            f"'That's a good point—I hadn't considered that angle.'\n\n"
-
-            f"OUTPUT FORMAT — STRICTLY INSIDE A SINGLE JSON CODE BLOCK:\n"
-            f"{{\n"
-            f'  "comment": "Your direct single-line LinkedIn comment here"\n'
-            f"}}\n"
-        )
+        prompt = COMMENT_PROMPT_TEMPLATE.format(post_content=post_content)
 
         print("[STEP] Entering prompt into textbox...", flush=True)
         textbox.first.fill(prompt)
@@ -393,7 +399,7 @@ def run():
                 custom_random_wait(30, 60)
             else:
                 print("❌ Max retries reached. Streaming failed. Exiting...", flush=True)
-                if 'page' in locals() and page:
+                if page:
                     try:
                         screenshot_path = "error_screenshot.png"
                         page.screenshot(path=screenshot_path, full_page=True)
@@ -443,7 +449,7 @@ def run():
                 
             except json.JSONDecodeError as je:
                 print(f"[ERROR] Content JSON parse error: {je}. Exiting...", flush=True)
-                if 'page' in locals() and page:
+                if page:
                     try:
                         screenshot_path = "error_screenshot.png"
                         page.screenshot(path=screenshot_path, full_page=True)
@@ -457,7 +463,7 @@ def run():
                 sys.exit(1)
         else:
             print("[ERROR] No data fetched from ChatGPT. Exiting...", flush=True)
-            if 'page' in locals() and page:
+            if page:
                 try:
                     screenshot_path = "error_screenshot.png"
                     page.screenshot(path=screenshot_path, full_page=True)
@@ -477,7 +483,7 @@ def run():
         raise
     except Exception as e:
         print("[ERROR]", e, flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
@@ -4,6 +4,7 @@ import json
 import time
 import base64
 import random
+import re
 import requests
 from pathlib import Path
 from typing import List, Dict, Any
@@ -36,6 +37,7 @@ print(f"[OK] Randomly selected cookie file: {CHATGPT_COOKIES_FILE.name}", flush=
 PBKDF2_ITERATIONS = 200_000
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+PROFILE_BUTTON_REGEX = re.compile(r'.*Free, open')
 
 
 # =========================
@@ -257,6 +259,7 @@ def run():
     pw = pw_cm.__enter__()
 
     browser = None
+    page = None
     try:
         browser = pw.chromium.launch(
             headless=HEADLESS,
@@ -290,7 +293,7 @@ def run():
 
         # CHECK LOGIN SUCCESS VIA USER PROFILE BUTTON
         print("[STEP] Checking login success via profile button...", flush=True)
-        profile_button = page.get_by_role('button', name=list(map(lambda x: x.compile(r'.*Free, open'), [__import__('re')]))[0])
+        profile_button = page.get_by_role('button', name=PROFILE_BUTTON_REGEX)
         
         if profile_button.count() > 0:
             print(f"[OK] LOGIN SUCCESS: Profile button found -> '{profile_button.first.get_attribute('aria-label') or 'User Account'}'", flush=True)
@@ -445,7 +448,7 @@ def run():
                 custom_random_wait(30, 60)
             else:
                 print("❌ Max retries reached. Streaming complete nahi ho payi. Exiting script...", flush=True)
-                if 'page' in locals() and page:
+                if page:
                     try:
                         screenshot_path = "error_screenshot.png"
                         page.screenshot(path=screenshot_path, full_page=True)
@@ -484,7 +487,7 @@ def run():
                 
             except json.JSONDecodeError as je:
                 print(f"[ERROR] Content JSON parse karne me fail hua: {je}. Exiting script...", flush=True)
-                if 'page' in locals() and page:
+                if page:
                     try:
                         screenshot_path = "error_screenshot.png"
                         page.screenshot(path=screenshot_path, full_page=True)
@@ -500,7 +503,7 @@ def run():
                 sys.exit(1)
         else:
             print("[ERROR] Save skip kiya gaya kyunki koi data fetch nahi hua. Exiting script...", flush=True)
-            if 'page' in locals() and page:
+            if page:
                 try:
                     screenshot_path = "error_screenshot.png"
                     page.screenshot(path=screenshot_path, full_page=True)
@@ -522,7 +525,7 @@ def run():
         raise
     except Exception as e:
         print("[ERROR]", e, flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
@@ -4,7 +4,6 @@ import json
 import time
 import base64
 import random
-import shutil
 import requests
 import re
 from pathlib import Path
@@ -43,6 +42,8 @@ PBKDF2_ITERATIONS = 200_000
 MAX_RETRIES = 10  
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+PROFILE_BUTTON_REGEX = re.compile(r'.*Free, open')
+GENERATED_IMAGE_REGEX = re.compile(r'Generated image:.*', re.IGNORECASE)
 
 
 # =========================
@@ -263,6 +264,7 @@ def run():
     pw = pw_cm.__enter__()
 
     browser = None
+    page = None
     try:
         browser = pw.chromium.launch(
             headless=HEADLESS,
@@ -307,7 +309,7 @@ def run():
 
         # CHECK LOGIN SUCCESS VIA USER PROFILE BUTTON
         print("[STEP] Checking login success via profile button...", flush=True)
-        profile_button = page.get_by_role('button', name=list(map(lambda x: x.compile(r'.*Free, open'), [__import__('re')]))[0])
+        profile_button = page.get_by_role('button', name=PROFILE_BUTTON_REGEX)
         
         if profile_button.count() > 0:
             print(f"[OK] LOGIN SUCCESS: Profile button found -> '{profile_button.first.get_attribute('aria-label') or 'User Account'}'", flush=True)
@@ -434,7 +436,7 @@ def run():
 
         if not found_share or not share_button:
             print("❌ Error: 'Share this image' button not found after 5 retries. Exiting program.", flush=True)
-            if 'page' in locals() and page:
+            if page:
                 try:
                     screenshot_path = "error_screenshot.png"
                     # Playwright full page screenshot
@@ -479,7 +481,7 @@ def run():
         # ========================================================
         print("[STEP] Executing Fallback 1: Searching for Generated image container...", flush=True)
         try:
-            generated_image_btn = page.get_by_role('button', name=re.compile(r'Generated image:.*', re.IGNORECASE)).first
+            generated_image_btn = page.get_by_role('button', name=GENERATED_IMAGE_REGEX).first
             if generated_image_btn.is_visible():
                 print("✅ Generated image area located via regex. Extracting inner image element...", flush=True)
                 
@@ -596,7 +598,7 @@ def run():
                 
             except Exception as download_err:
                 print(f"❌ Error during 'Save' button download processing: {download_err}", flush=True)
-                if 'page' in locals() and page:
+                if page:
                     try:
                         screenshot_path = "error_screenshot.png"
                         # Playwright full page screenshot
@@ -618,7 +620,7 @@ def run():
         raise
     except Exception as e:
         print("[ERROR]", e, flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 # Playwright full page screenshot
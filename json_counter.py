@@ -1,12 +1,15 @@
 import json
+from pathlib import Path
 from datetime import datetime, timedelta
 
 # 1. JSON file ko load karein
 file_name = 'scraped_connections.json'
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+WITHDRAW_AFTER_DAYS = 7  # withdraw_connection.py ke WITHDRAW_AFTER_DAYS ke saath sync rakhein
 
 try:
-    with open(file_name, 'r') as file:
-        data = json.load(file)
+    # Bytes seedha json.loads ko dein, alag se text decode layer ki zarurat nahi
+    data = json.loads(Path(file_name).read_bytes())
 except FileNotFoundError:
     print(f"Error: '{file_name}' file nahi mili. Please check karein.")
     exit()
@@ -14,30 +17,35 @@ except FileNotFoundError:
 # 2. Total elements calculate karein
 total_elements = len(data)
 
-# 3. Total withdrawn = True calculate karein
-total_withdrawn_true = sum(1 for item in data if item.get('withdrawn') is True)
-
-# 4. Remaining withdrawal calculate karein
-remaining_withdrawal = total_elements - total_withdrawn_true
-
-# 5. Latest timestamp find karein
-timestamps = []
+# 3 & 5. Ek hi pass me withdrawn = True count aur latest timestamp nikaalein
+total_withdrawn_true = 0
+latest_timestamp = None
 for item in data:
-    if 'timestamp' in item and item['timestamp']:
+    if item.get('withdrawn') is True:
+        total_withdrawn_true += 1
+
+    timestamp_str = item.get('timestamp')
+    if timestamp_str:
         try:
-            # String timestamp ko datetime object me convert karein
-            dt = datetime.strptime(item['timestamp'], "%Y-%m-%d %H:%M:%S")
-            timestamps.append(dt)
+            # fromisoformat C-level parser hai; bina zero-padding wale values (jaise 2025-1-9) ke liye strptime
+            try:
+                dt = datetime.fromisoformat(timestamp_str)
+            except ValueError:
+                dt = datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
         except ValueError:
-            pass # Agar koi timestamp galat format me ho toh use skip karein
+            continue # Agar koi timestamp galat format ya galat date ho toh use skip karein
+        if latest_timestamp is None or dt > latest_timestamp:
+            latest_timestamp = dt
+
+# 4. Remaining withdrawal calculate karein
+remaining_withdrawal = total_elements - total_withdrawn_true
 
 # Target timestamp aur status logic
 target_timestamp_str = "N/A"
-if timestamps:
-    latest_timestamp = max(timestamps)
-    # Latest timestamp me 7 days add karke target timestamp banayein
-    future_timestamp = latest_timestamp + timedelta(days=7)
-    target_timestamp_str = future_timestamp.strftime('%Y-%m-%d %H:%M:%S')
+if latest_timestamp is not None:
+    # Latest timestamp me WITHDRAW_AFTER_DAYS add karke target timestamp banayein
+    future_timestamp = latest_timestamp + timedelta(days=WITHDRAW_AFTER_DAYS)
+    target_timestamp_str = future_timestamp.strftime(TIMESTAMP_FORMAT)
     
     # Current system time
     current_time = datetime.now()
@@ -58,10 +66,10 @@ print(f"Total withdraw true: {total_withdrawn_true}")
 print(f"Remaining withdrawal: {remaining_withdrawal}")
 
 if isinstance(latest_timestamp, datetime):
-    print(f"Last/Latest timestamp: {latest_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Last/Latest timestamp: {latest_timestamp.strftime(TIMESTAMP_FORMAT)}")
 else:
     print(f"Last/Latest timestamp: {latest_timestamp}")
 
 # Naya print statement target timestamp ke liye
-print(f"Target timestamp (Latest + 7 days): {target_timestamp_str}")
+print(f"Target timestamp (Latest + {WITHDRAW_AFTER_DAYS} days): {target_timestamp_str}")
 print(f"Status: {status_message}")
\ No newline at end of file
@@ -1,4 +1,3 @@
-import os
 import sys
 import json
 import time
@@ -6,9 +5,8 @@ import random
 import requests
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dotenv import load_dotenv
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 # login.py se session import kiya gaya hai
 from login import login_and_get_context
 
@@ -19,6 +17,56 @@ HEADLESS = True
 STATUS_FILE = Path("comment_status.json")
 POST_DATA_FILE = Path("post_to_comment.json")
 COMMENTED_FILE = Path("commented.json")
+DOM_POLL_INTERVAL_MS = 250
+# Comment box se submit button tak focus le jaane ke liye TAB presses (aur unke baad ek wait)
+SUBMIT_TAB_COUNT = 3
+SUBMIT_TAB_WAIT_SEC = (1, 2)
+# Enter ke baad comment box khali hone ka max wait (khali = comment post ho gaya)
+COMMENT_POST_WAIT_MS = 12000
+# Priority order me DOM selectors (pehla visible match use hota hai)
+COMMENT_BOX_SELECTORS = [
+    "div.ql-editor[contenteditable='true']",
+    "div[contenteditable='true'][role='textbox']",
+    "div[role='textbox']",
+    "textarea.comments-comment-box__textarea",
+    ".ql-editor"
+]
+LIKE_BUTTON_SELECTORS = [
+    "button[aria-label*='React Like']",
+    "button[aria-label*='Like']",
+    "button.react-button__trigger",
+    "button.artdeco-button:has-text('Like')",
+    "button:has-text('Like')"
+]
+SCROLL_METRICS_JS = "[window.scrollY, document.body.scrollHeight - window.innerHeight]"
+# Selectors ki list me se pehle visible element wale selector ka index (-1 agar koi nahi)
+FIRST_VISIBLE_SELECTOR_JS = """
+    (selectors) => selectors.findIndex((sel) => {
+        // Playwright ka ":has-text('X')" suffix CSS nahi hai, isliye use text filter me badalte hain
+        const m = sel.match(/^(.*):has-text\\('(.*)'\\)$/);
+        const el = m
+            ? Array.from(document.querySelectorAll(m[1])).find(
+                (e) => (e.textContent || '').toLowerCase().includes(m[2].toLowerCase()))
+            : document.querySelector(sel);
+        if (!el) return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    })
+"""
+# wait_for_function ke liye: index 0 falsy hota hai, isliye object me wrap karke lautate hain
+FIRST_VISIBLE_SELECTOR_WAIT_JS = f"""
+    (selectors) => {{
+        const index = ({FIRST_VISIBLE_SELECTOR_JS})(selectors);
+        return index >= 0 ? {{ index }} : null;
+    }}
+"""
+# Har comment box selector ka pehla editor khali hai (ya maujood nahi) ya nahi
+COMMENT_BOX_CLEARED_JS = """
+    (selectors) => selectors.every((sel) => {
+        const el = document.querySelector(sel);
+        return !el || (el.innerText || el.value || '').trim() === '';
+    })
+"""
 
 # =========================
 # DYNAMIC WAITS & SCROLL
@@ -33,69 +81,79 @@ def slow_scroll_to_bottom(page, step_pixels: int = 250, delay_sec: float = 0.4):
     Dheere-dheere page ke bottom tak scroll karta hai taaki post elements load ho sakein.
     """
     print("[STEP] Dheere-dheere page scroll down kar rahe hain...", flush=True)
-    
+
+    # Har step pe scrollY aur max scroll ek hi evaluate call me padhte hain
+    current_scroll, _ = page.evaluate(SCROLL_METRICS_JS)
+
     while True:
-        current_scroll = page.evaluate("window.scrollY")
-        total_height = page.evaluate("document.body.scrollHeight - window.innerHeight")
-        
         page.mouse.wheel(0, step_pixels)
         time.sleep(delay_sec)
-        
-        new_scroll = page.evaluate("window.scrollY")
+
+        new_scroll, total_height = page.evaluate(SCROLL_METRICS_JS)
         if new_scroll == current_scroll or new_scroll >= total_height:
             print("[OK] Page completely scroll ho gaya.", flush=True)
             break
+        current_scroll = new_scroll
 
 # =========================
 # DOM DOMINANT INTERACTION HELPERS
 # =========================
+def wait_for_first_visible_selector(page, selectors: List[str], timeout_sec: float) -> Optional[str]:
+    """
+    Saare selectors ko browser ke andar hi poll karta hai aur pehla visible selector lautata hai (timeout ya error pe None).
+    """
+    try:
+        idx = page.wait_for_function(
+            FIRST_VISIBLE_SELECTOR_WAIT_JS, arg=selectors,
+            polling=DOM_POLL_INTERVAL_MS, timeout=max(int(timeout_sec * 1000), 1)
+        ).json_value()["index"]
+    except PlaywrightTimeoutError:
+        return None
+    except PlaywrightError as e:
+        # Navigation/closed target jaisi errors ko bhi "nahi mila" maan kar caller best-effort rahe
+        print(f"[WARNING] Selector wait failed: {e}", flush=True)
+        return None
+    return selectors[idx]
+
 def focus_and_click_comment_box(page, max_timeout: int = 15) -> bool:
     """
     DOM Selectors use karke Comment Box ko locate, scroll, aur focus karta hai.
     """
     print("[DOM SEARCH] Locating comment box via DOM selectors...", flush=True)
     
-    selectors = [
-        "div.ql-editor[contenteditable='true']",
-        "div[contenteditable='true'][role='textbox']",
-        "div[role='textbox']",
-        "textarea.comments-comment-box__textarea",
-        ".ql-editor"
-    ]
-    
-    start_time = time.time()
-    while time.time() - start_time < max_timeout:
-        for selector in selectors:
-            try:
-                elem = page.locator(selector).first
-                if elem.is_visible():
-                    elem.scroll_into_view_if_needed()
-                    custom_random_wait(0.5, 1.0)
-                    elem.click()
-                    
-                    # Ensure focus via JS for rich text editor
-                    page.evaluate("""
-                        (sel) => {
-                            const el = document.querySelector(sel);
-                            if (el) {
-                                el.focus();
-                                if (el.getAttribute('contenteditable') === 'true') {
-                                    const range = document.createRange();
-                                    const sel = window.getSelection();
-                                    range.selectNodeContents(el);
-                                    range.collapse(false);
-                                    sel.removeAllRanges();
-                                    sel.addRange(range);
-                                }
-                            }
+    deadline = time.time() + max_timeout
+    while time.time() < deadline:
+        selector = wait_for_first_visible_selector(page, COMMENT_BOX_SELECTORS, deadline - time.time())
+        if selector is None:
+            break
+        try:
+            elem = page.locator(selector).first
+            custom_random_wait(0.5, 1.0)
+            # click() khud hi element ko view me scroll kar deta hai, alag scroll call ki zarurat nahi
+            elem.click()
+
+            # Ensure focus via JS for rich text editor
+            page.evaluate("""
+                (sel) => {
+                    const el = document.querySelector(sel);
+                    if (el) {
+                        el.focus();
+                        if (el.getAttribute('contenteditable') === 'true') {
+                            const range = document.createRange();
+                            const sel = window.getSelection();
+                            range.selectNodeContents(el);
+                            range.collapse(false);
+                            sel.removeAllRanges();
+                            sel.addRange(range);
                         }
-                    """, selector)
-                    
-                    print(f"[SUCCESS] Comment box located and focused via selector: '{selector}'", flush=True)
-                    return True
-            except Exception:
-                continue
-        time.sleep(1)
+                    }
+                }
+            """, selector)
+
+            print(f"[SUCCESS] Comment box located and focused via selector: '{selector}'", flush=True)
+            return True
+        except PlaywrightError:
+            time.sleep(DOM_POLL_INTERVAL_MS / 1000)
         
     print("[ERROR] Comment box not found using DOM selectors.", flush=True)
     return False
@@ -106,28 +164,20 @@ def click_like_button(page, max_timeout: int = 10) -> bool:
     """
     print("[DOM SEARCH] Locating 'React Like' button via DOM selectors...", flush=True)
     
-    selectors = [
-        "button[aria-label*='React Like']",
-        "button[aria-label*='Like']",
-        "button.react-button__trigger",
-        "button.artdeco-button:has-text('Like')",
-        "button:has-text('Like')"
-    ]
-    
-    start_time = time.time()
-    while time.time() - start_time < max_timeout:
-        for selector in selectors:
-            try:
-                btn = page.locator(selector).first
-                if btn.is_visible():
-                    btn.scroll_into_view_if_needed()
-                    custom_random_wait(0.5, 1.0)
-                    btn.click()
-                    print(f"[SUCCESS] Post liked via selector: '{selector}'", flush=True)
-                    return True
-            except Exception:
-                continue
-        time.sleep(1)
+    deadline = time.time() + max_timeout
+    while time.time() < deadline:
+        selector = wait_for_first_visible_selector(page, LIKE_BUTTON_SELECTORS, deadline - time.time())
+        if selector is None:
+            break
+        try:
+            btn = page.locator(selector).first
+            custom_random_wait(0.5, 1.0)
+            # click() khud hi element ko view me scroll kar deta hai, alag scroll call ki zarurat nahi
+            btn.click()
+            print(f"[SUCCESS] Post liked via selector: '{selector}'", flush=True)
+            return True
+        except PlaywrightError:
+            time.sleep(DOM_POLL_INTERVAL_MS / 1000)
         
     print("[WARNING] Could not locate or click Like button via DOM selectors.", flush=True)
     return False
@@ -149,6 +199,35 @@ def upload_to_tmpfiles(screenshot_path):
         print(f"[WARNING] Upload Failed: {response.status_code}")
         return None
     
+# =========================
+# HISTORY & STATUS
+# =========================
+def finalize_comment_run(target_url: str, status_data: Dict[str, Any], finalize_msg: str, wait_range: Tuple[float, float]):
+    """
+    URL ko commented.json history me jodta hai, status ko posted mark karta hai aur wait ke baad reset karta hai.
+    """
+    commented_urls = []
+    if COMMENTED_FILE.exists():
+        with COMMENTED_FILE.open("r", encoding="utf-8") as f:
+            try: commented_urls = json.load(f)
+            except json.JSONDecodeError: commented_urls = []
+
+    if target_url not in commented_urls:
+        commented_urls.append(target_url)
+        with COMMENTED_FILE.open("w", encoding="utf-8") as f:
+            json.dump(commented_urls, f, indent=4, ensure_ascii=False)
+
+    status_data["comment_posted"] = True
+    with STATUS_FILE.open("w", encoding="utf-8") as f:
+        json.dump(status_data, f, indent=4, ensure_ascii=False)
+
+    print(finalize_msg, flush=True)
+    custom_random_wait(*wait_range)
+
+    reset_status = {"post_to_comment_found": False, "comment_generated": False, "comment_posted": False}
+    with STATUS_FILE.open("w", encoding="utf-8") as f:
+        json.dump(reset_status, f, indent=4, ensure_ascii=False)
+
 # =========================
 # MAIN
 # =========================
@@ -209,30 +288,7 @@ def run():
         if cannot_displayed_locator.count() > 0 and cannot_displayed_locator.first.is_visible():
             print("[INFO] 'This post cannot be displayed' found. Skipping to history & status update...", flush=True)
             
-            # 9. APPEND TO HISTORY
-            commented_urls = []
-            if COMMENTED_FILE.exists():
-                with COMMENTED_FILE.open("r", encoding="utf-8") as f:
-                    try: commented_urls = json.load(f)
-                    except: commented_urls = []
-            
-            if target_url not in commented_urls:
-                commented_urls.append(target_url)
-                with COMMENTED_FILE.open("w", encoding="utf-8") as f:
-                    json.dump(commented_urls, f, indent=4, ensure_ascii=False)
-
-            # 10. UPDATE STATUS
-            status_data["comment_posted"] = True
-            with STATUS_FILE.open("w", encoding="utf-8") as f:
-                json.dump(status_data, f, indent=4, ensure_ascii=False)
-
-            print("[STEP] Finalizing...", flush=True)
-            custom_random_wait(15, 30)
-            
-            reset_status = {"post_to_comment_found": False, "comment_generated": False, "comment_posted": False}
-            with STATUS_FILE.open("w", encoding="utf-8") as f:
-                json.dump(reset_status, f, indent=4, ensure_ascii=False)
-            
+            finalize_comment_run(target_url, status_data, "[STEP] Finalizing...", (15, 30))
             return
 
         # 4. CHECK GROUP RESTRICTION
@@ -241,29 +297,7 @@ def run():
 
         if restricted_text.count() > 0 and restricted_text.first.is_visible():
             print("[INFO] 'Only group members can...' restriction text found. Treating as SUCCESS.", flush=True)
-            
-            commented_urls = []
-            if COMMENTED_FILE.exists():
-                with COMMENTED_FILE.open("r", encoding="utf-8") as f:
-                    try: commented_urls = json.load(f)
-                    except: commented_urls = []
-            
-            if target_url not in commented_urls:
-                commented_urls.append(target_url)
-                with COMMENTED_FILE.open("w", encoding="utf-8") as f:
-                    json.dump(commented_urls, f, indent=4, ensure_ascii=False)
-
-            status_data["comment_posted"] = True
-            with STATUS_FILE.open("w", encoding="utf-8") as f:
-                json.dump(status_data, f, indent=4, ensure_ascii=False)
-
-            print("[STEP] Finalizing restricted post flow...", flush=True)
-            custom_random_wait(5, 10)
-            
-            reset_status = {"post_to_comment_found": False, "comment_generated": False, "comment_posted": False}
-            with STATUS_FILE.open("w", encoding="utf-8") as f:
-                json.dump(reset_status, f, indent=4, ensure_ascii=False)
-                
+            finalize_comment_run(target_url, status_data, "[STEP] Finalizing restricted post flow...", (5, 10))
             print("[SUCCESS] Exiting safely with code 0.", flush=True)
             return
 
@@ -281,7 +315,8 @@ def run():
         
         # 6. TYPE COMMENT
         print("[STEP] Typing comment...", flush=True)
-        page.keyboard.type(comment_text, delay=70)
+        # Har character ke liye alag keypress (70ms delay) ki jagah poora text ek hi input event me
+        page.keyboard.insert_text(comment_text)
         custom_random_wait(1, 2)
 
         # Executive Input Fallback
@@ -299,48 +334,43 @@ def run():
 
         custom_random_wait(1, 2)
 
-        # 7. SUBMIT COMMENT (3x TAB + 1x ENTER WITH RANDOM DELAYS)
-        print("[STEP] Submitting comment using Keyboard sequence (3 TABs + ENTER)...", flush=True)
-        for i in range(1, 4):
+        # 7. SUBMIT COMMENT (TABs + 1x ENTER)
+        print(f"[STEP] Submitting comment using Keyboard sequence ({SUBMIT_TAB_COUNT} TABs + ENTER)...", flush=True)
+        # Focus move ke liye har TAB ke baad wait ki zarurat nahi, saare TABs ke baad ek hi wait
+        for _ in range(SUBMIT_TAB_COUNT):
             page.keyboard.press("Tab")
-            print(f"[KEYBOARD] Pressed TAB ({i}/3)", flush=True)
-            custom_random_wait(1, 2)
+        print(f"[KEYBOARD] Pressed TAB x{SUBMIT_TAB_COUNT}", flush=True)
+        custom_random_wait(*SUBMIT_TAB_WAIT_SEC)
 
         page.keyboard.press("Enter")
         print("[KEYBOARD] Pressed ENTER to post comment.", flush=True)
-        custom_random_wait(6, 12)
-
-        # 8. CLICK LIKE BUTTON VIA DOM
-        print("[STEP] Locating 'React Like' button via DOM...", flush=True)
-        like_clicked = click_like_button(page, max_timeout=10)
-
-        # 9. APPEND TO HISTORY
-        commented_urls = []
-        if COMMENTED_FILE.exists():
-            with COMMENTED_FILE.open("r", encoding="utf-8") as f:
-                try: commented_urls = json.load(f)
-                except: commented_urls = []
-        
-        if target_url not in commented_urls:
-            commented_urls.append(target_url)
-            with COMMENTED_FILE.open("w", encoding="utf-8") as f:
-                json.dump(commented_urls, f, indent=4, ensure_ascii=False)
-
-        # 10. UPDATE STATUS
-        status_data["comment_posted"] = True
-        with STATUS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(status_data, f, indent=4, ensure_ascii=False)
-
-        print("[STEP] Finalizing...", flush=True)
-        custom_random_wait(15, 30)
-        
-        reset_status = {"post_to_comment_found": False, "comment_generated": False, "comment_posted": False}
-        with STATUS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(reset_status, f, indent=4, ensure_ascii=False)
+
+        # Enter dab chuka hai: aage kuch bhi fail ho, history/status update zaroor ho
+        # taaki agle run me same post pe dobara comment na jaye
+        try:
+            # Blind 6-12s wait ki jagah editor khali hote hi aage badhein
+            try:
+                page.wait_for_function(
+                    COMMENT_BOX_CLEARED_JS, arg=COMMENT_BOX_SELECTORS,
+                    polling=DOM_POLL_INTERVAL_MS, timeout=COMMENT_POST_WAIT_MS
+                )
+                print("[OK] Comment box cleared, comment posted.", flush=True)
+            except PlaywrightTimeoutError:
+                print(f"[WARNING] Comment box {COMMENT_POST_WAIT_MS} ms me clear nahi hua, aage badh rahe hain...", flush=True)
+            except PlaywrightError as wait_err:
+                print(f"[WARNING] Comment box clear check fail hua ({wait_err}), aage badh rahe hain...", flush=True)
+            custom_random_wait(1, 2)
+
+            # 8. CLICK LIKE BUTTON VIA DOM
+            print("[STEP] Locating 'React Like' button via DOM...", flush=True)
+            click_like_button(page, max_timeout=10)
+        finally:
+            # 9 & 10. APPEND TO HISTORY + UPDATE STATUS
+            finalize_comment_run(target_url, status_data, "[STEP] Finalizing...", (15, 30))
 
     except Exception as e:
         print("[ERROR] Script crashed:", e, flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
@@ -351,8 +381,8 @@ def run():
                 print(f"[WARNING] Could not capture or upload screenshot: {screenshot_err}", flush=True)
         sys.exit(1)
     finally:
-        if 'browser' in locals() and browser: browser.close()
-        if 'pw' in locals() and pw: pw.stop()
+        if browser: browser.close()
+        if pw: pw.stop()
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -3,7 +3,8 @@ import sys
 import time
 import json
 import base64
-from datetime import datetime, timezone, timedelta
+import re
+from datetime import timezone, timedelta
 from typing import Optional, Tuple
 
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -17,7 +18,6 @@ from playwright_stealth import Stealth
 HEADLESS = True
 LOGIN_URL = "https://www.linkedin.com/login"
 HOME_URL = "https://www.linkedin.com/feed/"
-BASE_URL = "https://www.linkedin.com/"
 CHALLENGE_PREFIX = "https://www.linkedin.com/checkpoint/challenge"
 CHALLENGE_V2_PREFIX = "https://www.linkedin.com/checkpoint/challengesV2/"
 
@@ -27,6 +27,17 @@ ENCRYPTED_COOKIE_FILES = [
 ]
 SESSION_COOKIE_NAME = "li_at"
 IST = timezone(timedelta(hours=5, minutes=30), name="IST")
+# Images, fonts aur video jo text-only scraping me kabhi read nahi hote
+HEAVY_RESOURCE_URL_REGEX = re.compile(
+    r"(\.(png|jpe?g|gif|webp|svg|ico|woff2?|ttf|otf|mp4|webm)(\?.*)?$)|media\.licdn\.com/dms/image/",
+    re.IGNORECASE,
+)
+# Third-party ads/analytics beacons jo page ke core requests se bandwidth cheente hain
+TRACKER_URL_REGEX = re.compile(
+    r"^https?://([^/]*\.)?(doubleclick\.net|google-analytics\.com|googletagmanager\.com|"
+    r"googlesyndication\.com|hotjar\.com|px\.ads\.linkedin\.com|snap\.licdn\.com)/",
+    re.IGNORECASE,
+)
 
 # --- Cookie Helpers ---
 
@@ -85,7 +96,14 @@ def _handle_challenge_if_present(page: Page):
         page.wait_for_url(lambda url: CHALLENGE_PREFIX not in url and CHALLENGE_V2_PREFIX not in url, timeout=0)
         print("[Captcha] Challenge completed.", flush=True)
 
-def login_and_get_context(is_headless: bool = HEADLESS):
+def login_and_get_context(is_headless: bool = HEADLESS, block_heavy_resources: bool = False):
+    # Sasti checks pehle: na valid cookie ho na credentials, toh browser launch hi na karein
+    cookie, expired = _read_session_cookie_from_disk()
+    load_dotenv()
+    email, password = os.getenv("EMAIL"), os.getenv("PASSWORD")
+    if (not cookie or expired) and (not email or not password):
+        raise RuntimeError("Missing EMAIL/PASSWORD in .env")
+
     stealth = Stealth()
     pw_cm = stealth.use_sync(sync_playwright())
     pw = pw_cm.__enter__()
@@ -98,12 +116,15 @@ def login_and_get_context(is_headless: bool = HEADLESS):
         no_viewport=True,
         user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
     )
+    if block_heavy_resources:
+        # Regex route driver side pe match hota hai, isliye baaki requests Python tak nahi aati
+        context.route(HEAVY_RESOURCE_URL_REGEX, lambda route: route.abort())
+        context.route(TRACKER_URL_REGEX, lambda route: route.abort())
     page = context.new_page()
 
     # 1. Cookie Login
-    cookie, expired = _read_session_cookie_from_disk()
     if cookie and not expired:
-        page.goto(BASE_URL)
+        # Cookie me domain/path diya hai, isliye add_cookies se pehle koi navigation zaroori nahi
         clean_cookie = {
             "name": SESSION_COOKIE_NAME,
             "value": cookie["value"],
@@ -126,8 +147,6 @@ def login_and_get_context(is_headless: bool = HEADLESS):
             print("[Cookie] Session invalid. Proceeding to credentials.", flush=True)
 
     # 2. Credential Login
-    load_dotenv()
-    email, password = os.getenv("EMAIL"), os.getenv("PASSWORD")
     if not email or not password:
         raise RuntimeError("Missing EMAIL/PASSWORD in .env")
 
@@ -1,4 +1,3 @@
-import os
 import sys
 import json
 import time
@@ -6,10 +5,8 @@ import random
 import re
 import requests
 from pathlib import Path
-from typing import List, Dict, Any
-from dotenv import load_dotenv
+from typing import Dict, Any
 
-from playwright.sync_api import sync_playwright
 # login.py se session import kiya gaya hai
 from login import login_and_get_context
 
@@ -20,6 +17,7 @@ HEADLESS = True
 TOPICS_FILE = "ujjawal_linkedin_topics.json"
 POST_FILE = "post.json"
 IMAGE_PATH = "image/image.png"
+MULTI_NEWLINE_REGEX = re.compile(r'\n+')
 
 # =========================
 # DYNAMIC WAITS
@@ -38,13 +36,13 @@ def step_wait():
 # TEXT PARSING HELPER
 # =========================
 def clean_and_format_post(post_data: Dict[str, Any]) -> str:
-    p1 = re.sub(r'\n+', '\n', post_data.get("p1", ""))
-    p2 = re.sub(r'\n+', '\n', post_data.get("p2", ""))
-    p3 = re.sub(r'\n+', '\n', post_data.get("p3", ""))
-    conclusion = re.sub(r'\n+', '\n', post_data.get("conclusion", ""))
+    p1 = MULTI_NEWLINE_REGEX.sub('\n', post_data.get("p1", ""))
+    p2 = MULTI_NEWLINE_REGEX.sub('\n', post_data.get("p2", ""))
+    p3 = MULTI_NEWLINE_REGEX.sub('\n', post_data.get("p3", ""))
+    conclusion = MULTI_NEWLINE_REGEX.sub('\n', post_data.get("conclusion", ""))
     
     combined_body = f"{p1}\n{p2}\n{p3}\n{conclusion}"
-    combined_body = re.sub(r'\n+', '\n', combined_body)
+    combined_body = MULTI_NEWLINE_REGEX.sub('\n', combined_body)
     
     keywords = post_data.get("keywords", [])
     hashtags = " ".join([f"#{kw.strip()}" for kw in keywords])
@@ -52,6 +50,19 @@ def clean_and_format_post(post_data: Dict[str, Any]) -> str:
     full_text = f"{combined_body}\n{hashtags}"
     return full_text
 
+# =========================
+# EDITOR INPUT
+# =========================
+def insert_post_text(page, text: str):
+    """
+    Har line ko ek hi input event me insert karta hai aur lines ke beech Enter dabata hai.
+    """
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            page.keyboard.press("Enter")
+        if line:
+            page.keyboard.insert_text(line)
+
 def upload_to_tmpfiles(screenshot_path):
     url = "https://tmpfiles.org/api/v1/upload"
     
@@ -131,7 +142,8 @@ def run():
         full_post_text = clean_and_format_post(post_data)
         editor = page.get_by_role('textbox', name='Text editor for creating')
         editor.focus()
-        editor.press_sequentially(full_post_text, delay=40, timeout=0)
+        # Character-by-character typing (40ms/char) ki jagah line-wise insert
+        insert_post_text(page, full_post_text)
         step_wait()
 
         print("[STEP] Uploading media...", flush=True)
@@ -156,7 +168,7 @@ def run():
 
     except Exception as e:
         print("[ERROR] Script crashed:", e, flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
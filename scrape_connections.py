@@ -5,11 +5,9 @@ import time
 import random
 import re  # Hidden characters aur special verified string patterns clean karne ke liye
 import requests
-from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict
 
-from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 # login.py se session import kiya gaya hai
 from login import login_and_get_context
 
@@ -19,6 +17,11 @@ from login import login_and_get_context
 HEADLESS = True
 TARGET_URL = "https://www.linkedin.com/search/results/people/?keywords=advocate&origin=FACETED_SEARCH&geoUrn=%5B%22113536609%22%5D"
 OUTPUT_FILE = "scraped_connections.json"
+RESULTS_WAIT_MS = 5000
+INVITE_LINK_REGEX = re.compile(r"^Invite .+ to connect$")
+VERIFIED_SUFFIX_REGEX = re.compile(r'\s+Verified$')
+# Har link ka [innerText, href] ek hi JS call me
+LINK_TEXT_HREF_JS = "links => links.map(a => [a.innerText || '', a.getAttribute('href')])"
 
 # =========================
 # DYNAMIC WAITS
@@ -37,20 +40,13 @@ def clear_json_file(file_path: str):
         json.dump([], f)
 
 
-def append_to_json(file_path: str, data: Dict[str, str]):
-    existing_data = []
-    path = Path(file_path)
-    if path.exists() and path.stat().st_size > 0:
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-        except Exception:
-            existing_data = []
-    
-    existing_data.append(data)
-    
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(existing_data, f, ensure_ascii=False, indent=4)
+def save_json(file_path: str, data: List[Dict[str, str]]):
+    # Poori list memory me rehti hai, isliye har append pe file dobara read/parse nahi karni padti
+    # Temp file + rename se crash ke waqt bhi file kabhi aadhi-likhi nahi rehti
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, file_path)
 
 def upload_to_tmpfiles(screenshot_path):
     url = "https://tmpfiles.org/api/v1/upload"
@@ -76,11 +72,12 @@ def run():
     print("[START] Script started", flush=True)
 
     clear_json_file(OUTPUT_FILE)
+    scraped_profiles: List[Dict[str, str]] = []
 
     # SESSION INITIALIZATION VIA login.py
     print("[STEP] Initializing session via login.py...", flush=True)
     try:
-        pw, browser, context, page = login_and_get_context(is_headless=HEADLESS)
+        pw, browser, context, page = login_and_get_context(is_headless=HEADLESS, block_heavy_resources=True)
     except Exception as e:
         print(f"[ERROR] Login session failed: {e}", flush=True)
         sys.exit(1)
@@ -103,13 +100,19 @@ def run():
             url_to_navigate = TARGET_URL if current_page == 1 else f"{TARGET_URL}&page={current_page}"
             print(f"[STEP] Navigating to target page {current_page}: {url_to_navigate}", flush=True)
             page.goto(url_to_navigate, wait_until="load")
-            page.wait_for_timeout(5000)
 
-            all_links = page.get_by_role('link').all()
-            
-            if not all_links:
+            # Fixed 5s sleep ki jagah pehla 'Invite ... to connect' link dikhte hi aage badho
+            try:
+                page.get_by_role('link', name=INVITE_LINK_REGEX).first.wait_for(state="visible", timeout=RESULTS_WAIT_MS)
+            except PlaywrightTimeoutError:
+                print(f"[INFO] No invite link appeared within {RESULTS_WAIT_MS} ms on page {current_page}.", flush=True)
+
+            # Saare links ka text aur href ek hi round-trip me nikaal lo (per-link calls nahi)
+            all_links_data = page.get_by_role('link').evaluate_all(LINK_TEXT_HREF_JS)
+
+            if not all_links_data:
                 print(f"[INFO] No role links found on page {current_page}.", flush=True)
-                if 'page' in locals() and page:
+                if page:
                     try:
                         screenshot_path = "error_screenshot.png"
                         page.screenshot(path=screenshot_path, full_page=True)
@@ -123,38 +126,34 @@ def run():
             profiles_scraped_on_this_page = 0
             processed_names = set()
 
-            for link in all_links:
+            for raw_text, profile_url in all_links_data:
                 try:
-                    raw_text = link.inner_text()
-                    if not raw_text:
+                    # Bina href wale links se profile nahi banti, unke liye connect locator query bhi na karein
+                    if not raw_text or not profile_url:
                         continue
                     
                     # Newline aur extra/hidden spaces ko clean karke single space se normalize karein
-                    normalized_text = re.sub(r'\s+', ' ', raw_text).strip()
+                    # (str.split() regex engine ke bina hi har whitespace run pe todta hai)
+                    normalized_text = " ".join(raw_text.split())
                     
                     if not normalized_text or len(normalized_text) > 80:
                         continue
                     
                     # Cleaned name nikalne ke liye 'Verified' check lagayein
                     if "Verified" in normalized_text:
-                        clean_name = re.sub(r'\s+Verified$', '', normalized_text).strip()
+                        clean_name = VERIFIED_SUFFIX_REGEX.sub('', normalized_text).strip()
                     else:
                         clean_name = normalized_text
 
                     if not clean_name or clean_name in processed_names:
                         continue
 
-                    # Name match karne ke liye flexible regex patterns jo normal aur verified dono ko handle karein
-                    name_regex = re.compile(rf"^{re.escape(clean_name)}(\s+Verified)?$")
-                    name_locator = page.get_by_role('link', name=name_regex, exact=True)
-                    
                     # Connect text button ke liye cleaned structural identity pass karein
                     connect_locator = page.get_by_role('link', name=f'Invite {clean_name} to connect', exact=True)
 
-                    if name_locator.count() > 0 and connect_locator.count() > 0:
+                    if connect_locator.count() > 0:
                         processed_names.add(clean_name)
-                        profile_url = name_locator.first.get_attribute("href")
-                        if profile_url and profile_url.startswith("/"):
+                        if profile_url.startswith("/"):
                             profile_url = f"https://www.linkedin.com{profile_url}"
 
                         print(f"[SCRAPE] Match found strictly via specified locators: {clean_name}", flush=True)
@@ -162,7 +161,8 @@ def run():
                             "name": clean_name,
                             "profile_link": profile_url
                         }
-                        append_to_json(OUTPUT_FILE, profile_data)
+                        scraped_profiles.append(profile_data)
+                        save_json(OUTPUT_FILE, scraped_profiles)
                         profiles_scraped_on_this_page += 1
                         
                 except Exception:
@@ -189,7 +189,7 @@ def run():
         raise
     except Exception as e:
         print("[ERROR] Script execution broke down due to trace:", e, flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
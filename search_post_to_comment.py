@@ -1,4 +1,3 @@
-import os
 import sys
 import json
 import time
@@ -6,10 +5,7 @@ import random
 import re
 import requests
 from pathlib import Path
-from typing import List, Dict, Any
 
-from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
 # login.py se function import karna hoga
 from login import login_and_get_context 
 
@@ -19,6 +15,8 @@ from login import login_and_get_context
 HEADLESS = True
 JSON_OUTPUT_FILE = "post_to_comment.json"
 STATUS_FILE = "comment_status.json"
+SORT_BY_TOP_REGEX = re.compile(r"Sort by: Top", re.IGNORECASE)
+CONTROL_MENU_REGEX = re.compile(r"Open control menu for post by.*", re.IGNORECASE)
 
 # =========================
 # DYNAMIC WAITS
@@ -68,12 +66,13 @@ def run():
 
     # 2. Use login.py for session
     print("[STEP] Initializing session via login.py...", flush=True)
+    pw = browser = context = page = None
     try:
         pw, browser, context, page = login_and_get_context(is_headless=HEADLESS)
         context.grant_permissions(["clipboard-read", "clipboard-write"])
     except Exception as e:
         print(f"[ERROR] Login failed: {e}", flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
@@ -93,7 +92,7 @@ def run():
         print("[STEP] Changing feed sort to Recent...", flush=True)
         try:
             # 'Sort by: Top' button par click karein
-            page.get_by_role("button", name=re.compile(r"Sort by: Top", re.IGNORECASE)).click()
+            page.get_by_role("button", name=SORT_BY_TOP_REGEX).click()
             custom_random_wait(6, 12)
             page.get_by_text("Recent", exact=True).click()
             print("[INFO] Feed sorted to Recent...", flush=True)
@@ -104,7 +103,7 @@ def run():
 
         # 3. Locate and click control menu
         print("[STEP] Locating control menu for the first post...", flush=True)
-        control_menu_btn = page.get_by_role("button", name=re.compile(r"Open control menu for post by.*", re.IGNORECASE)).first
+        control_menu_btn = page.get_by_role("button", name=CONTROL_MENU_REGEX).first
         control_menu_btn.click()
         custom_random_wait(6, 12)
 
@@ -125,7 +124,7 @@ def run():
                 commented_data = json.load(f)
                 if trimmed_url in commented_data:
                     print(f"[INFO] URL already commented. Exiting.", flush=True)
-                    if 'page' in locals() and page:
+                    if page:
                         try:
                             screenshot_path = "error_screenshot.png"
                             page.screenshot(path=screenshot_path, full_page=True)
@@ -143,7 +142,7 @@ def run():
         
         if len(post_content) < 150:
             print("[FAIL] Content too short.", flush=True)
-            if 'page' in locals() and page:
+            if page:
                 try:
                     screenshot_path = "error_screenshot.png"
                     page.screenshot(path=screenshot_path, full_page=True)
@@ -9,8 +9,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
-from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
 # login.py se session import kiya gaya hai
 from login import login_and_get_context
 
@@ -40,8 +38,11 @@ def load_connections(file_path: Path) -> List[Dict[str, Any]]:
 
 
 def save_connections(file_path: Path, data: List[Dict[str, Any]]):
-    with file_path.open("w", encoding="utf-8") as f:
+    # Pehle temp file me likh kar phir rename, taaki beech me crash hone par original file corrupt na ho
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
     print(f"[INFO] Saved status updates to {file_path.name}", flush=True)
 
 def upload_to_tmpfiles(screenshot_path):
@@ -76,11 +77,12 @@ def run():
 
     # SESSION INITIALIZATION VIA login.py
     print("[STEP] Initializing session via login.py...", flush=True)
+    pw = browser = context = page = None
     try:
         pw, browser, context, page = login_and_get_context(is_headless=HEADLESS)
     except Exception as e:
         print(f"[ERROR] Login session failed: {e}", flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
@@ -125,7 +127,7 @@ def run():
                 regex_pattern = re.compile(f"Invite {re.escape(name)}", re.IGNORECASE)
                 connect_button = page.get_by_test_id('lazy-column').get_by_role('link', name=regex_pattern)
 
-                if connect_button.is_visible() or connect_button.count() > 0:
+                if connect_button.count() > 0:
                     print(f"[ACTION] 'Invite' button found for {name}. Clicking now...", flush=True)
                     connect_button.click()
                     
@@ -134,7 +136,7 @@ def run():
 
                     # Confirmation button handle karna
                     confirm_button = page.get_by_role('button', name='Send without a note', exact=True)
-                    if confirm_button.is_visible() or confirm_button.count() > 0:
+                    if confirm_button.count() > 0:
                         print("[ACTION] 'Send without a note' clicked.", flush=True)
                         confirm_button.click()
                         
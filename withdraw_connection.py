@@ -10,7 +10,6 @@ from pathlib import Path
 from typing import List, Dict, Any
 
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
 # login.py se session import kiya gaya hai
 from login import login_and_get_context
 
@@ -19,6 +18,7 @@ from login import login_and_get_context
 # =========================
 HEADLESS = True
 CONNECTIONS_FILE = "scraped_connections.json"
+WITHDRAW_AFTER_DAYS = 7
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 
 # =========================
@@ -41,8 +41,11 @@ def load_connections(file_path: Path) -> List[Dict[str, Any]]:
 
 
 def save_connections(file_path: Path, data: List[Dict[str, Any]]):
-    with file_path.open("w", encoding="utf-8") as f:
+    # Pehle temp file me likh kar phir rename, taaki beech me crash hone par original file corrupt na ho
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
     print(f"[INFO] Saved status updates to {file_path.name}", flush=True)
 
 def upload_to_tmpfiles(screenshot_path):
@@ -77,7 +80,7 @@ def run():
 
     target_item = None
     target_index = -1
-    seven_days_ago = datetime.now() - timedelta(days=7)
+    withdraw_cutoff = datetime.now() - timedelta(days=WITHDRAW_AFTER_DAYS)
 
     # 1. JSON filter validation conditions check karna
     for index, item in enumerate(connections):
@@ -89,8 +92,8 @@ def run():
                     # Expected format matching your logs: "YYYY-MM-DD HH:MM:SS"
                     item_time = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
                     
-                    # Condition B: Timestamp 7 din se pehle (old) ka hona chahiye
-                    if item_time < seven_days_ago:
+                    # Condition B: Timestamp WITHDRAW_AFTER_DAYS din se pehle (old) ka hona chahiye
+                    if item_time < withdraw_cutoff:
                         target_item = item
                         target_index = index
                         break
@@ -99,7 +102,7 @@ def run():
 
     # Agar koi profile conditions meet nahi karti, toh sysexit0
     if target_item is None:
-        print("[INFO] No profiles found with withdrawn=False and timestamp older than 7 days. Exiting.", flush=True)
+        print(f"[INFO] No profiles found with withdrawn=False and timestamp older than {WITHDRAW_AFTER_DAYS} days. Exiting.", flush=True)
         sys.exit(0)
 
     name = target_item.get("name", "Unknown")
@@ -113,11 +116,12 @@ def run():
 
     # SESSION INITIALIZATION VIA login.py
     print("[STEP] Initializing session via login.py...", flush=True)
+    pw = browser = context = page = None
     try:
         pw, browser, context, page = login_and_get_context(is_headless=HEADLESS)
     except Exception as e:
         print(f"[ERROR] Login session failed: {e}", flush=True)
-        if 'page' in locals() and page:
+        if page:
             try:
                 screenshot_path = "error_screenshot.png"
                 page.screenshot(path=screenshot_path, full_page=True)
@@ -146,7 +150,7 @@ def run():
         pending_button = page.get_by_test_id('lazy-column').get_by_role('link', name='Pending, click to withdraw')
 
         # Check if Pending button is visible
-        if pending_button.is_visible() or pending_button.count() > 0:
+        if pending_button.count() > 0:
             print("[ACTION] Pending button found. Clicking to open withdraw modal...", flush=True)
             pending_button.click()
             
@@ -157,7 +161,7 @@ def run():
             confirm_regex = re.compile(r"Withdraw invitation sent to", re.IGNORECASE)
             withdraw_confirm_btn = page.get_by_role('button', name=confirm_regex)
 
-            if withdraw_confirm_btn.is_visible() or withdraw_confirm_btn.count() > 0:
+            if withdraw_confirm_btn.count() > 0:
                 print("[ACTION] Clicking confirmation 'Withdraw invitation sent to' button.", flush=True)
                 withdraw_confirm_btn.click()
                 